@@ -86,6 +86,9 @@ class HashConverter(BaseConverter):
 
 app.config["SQLALCHEMY_DATABASE_URI"] = app_config.mwdb.postgres_uri
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Use psycopg2 execute_values/execute_batch helpers for executemany()
+# (e.g. flushing multiple permissions or attributes at once)
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"executemany_mode": "values"}
 app.config["SECRET_KEY"] = app_config.mwdb.secret_key
 """
 Flask-restful tries to be smart and transforms NotFound exceptions.
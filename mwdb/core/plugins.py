@@ -189,14 +189,12 @@ def call_hook(hook_name, *args, **kwargs):
     global _plugin_handlers
 
     if not hasattr(PluginHookBase, hook_name):
-        logger.warning("Undefined hook: {}".format(hook_name))
+        logger.warning("Undefined hook: %s", hook_name)
         return
 
     if not app_config.mwdb.enable_hooks:
         logger.info(
-            "Hook {} will not be ran because enable_hooks is disabled.".format(
-                hook_name
-            )
+            "Hook %s will not be ran because enable_hooks is disabled.", hook_name
         )
         return
 
@@ -205,7 +203,7 @@ def call_hook(hook_name, *args, **kwargs):
             fn = getattr(hook_handler, hook_name)
             fn(*args, **kwargs)
         except Exception:
-            logger.exception("Hook {} raised exception".format(hook_name))
+            logger.exception("Hook %s raised exception", hook_name)
 
 
 hooks = PluginHookBase()
@@ -1,3 +1,5 @@
+from copy import copy
+from functools import lru_cache
 from typing import Any, List, Optional, Type, TypeVar, Union
 
 from flask import g
@@ -31,6 +33,27 @@ T = TypeVar("T", bound=Term)
 Condition = Any
 
 
+# Longer queries are parsed without caching to limit memory used by the cache
+MAX_CACHED_QUERY_LENGTH = 4096
+
+
+@lru_cache(maxsize=1024)
+def _parse_query_cached(query: str) -> Item:
+    return parser.parse(query)
+
+
+def parse_query(query: str) -> Item:
+    """
+    Parses Lucene query. Results are cached per process, because the same
+    queries (e.g. quick queries) are sent repeatedly.
+
+    Returned tree may be shared, so it must be treated as immutable.
+    """
+    if len(query) > MAX_CACHED_QUERY_LENGTH:
+        return parser.parse(query)
+    return _parse_query_cached(query)
+
+
 class SQLQueryBuilderContext:
     def __init__(self, queried_type: Optional[Type[Object]] = None):
         self.queried_type = queried_type or Object
@@ -51,7 +74,8 @@ class SQLQueryBuilder(LuceneTreeVisitorV2):
         - performs wildcard mapping and unescaping
         - wildcards are not allowed inside ranges
 
-        Returns mapped node
+        Returns mapped node. Parsed tree is cached and shared between queries,
+        so original node must not be modified.
         """
         if context.field_mapper is None:
             raise FieldNotQueryableException(
@@ -67,21 +91,25 @@ class SQLQueryBuilder(LuceneTreeVisitorV2):
 
         if context.field_mapper.accepts_range and not is_range_term:
             if node.value.startswith(">="):
+                node = copy(node)
                 node.value = node.value[2:]
                 return Range(
                     low=node, high=Term("*"), include_low=True, include_high=False
                 )
             elif node.value.startswith(">"):
+                node = copy(node)
                 node.value = node.value[1:]
                 return Range(
                     low=node, high=Term("*"), include_low=False, include_high=False
                 )
             elif node.value.startswith("<="):
+                node = copy(node)
                 node.value = node.value[2:]
                 return Range(
                     low=Term("*"), high=node, include_low=False, include_high=True
                 )
             elif node.value.startswith("<"):
+                node = copy(node)
                 node.value = node.value[1:]
                 return Range(
                     low=Term("*"), high=node, include_low=False, include_high=False
@@ -104,6 +132,7 @@ class SQLQueryBuilder(LuceneTreeVisitorV2):
         Visitor for Phrase. Phrases are enquoted Terms.
         """
         # Strip the " from start and end
+        node = copy(node)
         node.value = node.value[1:-1]
         return self.visit_term(node, parents, context)
 
@@ -120,9 +149,12 @@ class SQLQueryBuilder(LuceneTreeVisitorV2):
                 "Range queries are not supported for this type of field"
             )
 
-        node.low = self.visit(node.low, parents + [node], context)
-        node.high = self.visit(node.high, parents + [node], context)
-        return node
+        return Range(
+            low=self.visit(node.low, parents + [node], context),
+            high=self.visit(node.high, parents + [node], context),
+            include_low=node.include_low,
+            include_high=node.include_high,
+        )
 
     # Visitor methods for fields
 
@@ -212,6 +244,6 @@ class SQLQueryBuilder(LuceneTreeVisitorV2):
     # Main function
     def build_query(self, query: str, queried_type: Optional[Type[Object]] = None):
         context = SQLQueryBuilderContext(queried_type=queried_type)
-        tree = parser.parse(query)
+        tree = parse_query(query)
         condition = self.visit(tree, context=context)
         return db.session.query(context.queried_type).filter(condition)
@@ -14,7 +14,9 @@ class TextBlob(Object):
     blob_name = db.Column(db.String, nullable=False, index=True)
     blob_size = db.Column(db.Integer, nullable=False, index=True)
     blob_type = db.Column(db.String(32), nullable=False, index=True)
-    _content = db.Column("content", db.String(), nullable=False)
+    # Content is loaded on first access, so listings and re-uploads
+    # don't need to fetch (and detoast) it
+    _content = db.deferred(db.Column("content", db.String(), nullable=False))
     last_seen = db.Column(db.DateTime, nullable=False, index=True)
 
     __mapper_args__ = {
@@ -29,14 +31,19 @@ class TextBlob(Object):
     def get_or_create(
         cls, content, blob_name, blob_type, parent=None, metakeys=None, share_with=None
     ):
-        dhash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        # Encode content once and reuse it for both hash and size (in bytes)
+        content_bytes = content.encode("utf-8")
+        dhash = hashlib.sha256(content_bytes).hexdigest()
+        # The same timestamp is used for upload_time and last_seen
+        now = datetime.datetime.utcnow()
 
         blob_obj = TextBlob(
             dhash=dhash,
             blob_name=blob_name,
-            blob_size=len(content),
+            blob_size=len(content_bytes),
             blob_type=blob_type,
-            last_seen=datetime.datetime.utcnow(),
+            upload_time=now,
+            last_seen=now,
             _content=content.encode("unicode_escape").decode("utf-8"),
         )
         blob_obj, is_new = cls._get_or_create(
@@ -44,6 +51,6 @@ class TextBlob(Object):
         )
         # If object exists yet: we need to refresh last_seen timestamp
         if not is_new:
-            blob_obj.last_seen = datetime.datetime.utcnow()
+            blob_obj.last_seen = now
 
         return blob_obj, is_new
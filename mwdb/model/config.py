@@ -11,11 +11,16 @@ class Config(Object):
     __tablename__ = "static_config"
 
     id = db.Column(db.Integer, db.ForeignKey("object.id"), primary_key=True)
-    family = db.Column(db.String(32), nullable=False, index=True)
+    family = db.Column(db.String(32), nullable=False)
     config_type = db.Column(
         db.String(32), index=True, nullable=False, server_default="static"
     )
-    _cfg = db.Column("cfg", JSONB, nullable=False)
+    # Configuration is loaded on first access, so listings don't need
+    # to fetch and decode JSONB documents
+    _cfg = db.deferred(db.Column("cfg", JSONB, nullable=False))
+    # Covers both family lookups and per-family statistics
+    # (stats query can read families and join objects using index-only scan)
+    __table_args__ = (db.Index("ix_static_config_family_id", "family", "id"),)
 
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
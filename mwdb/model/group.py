@@ -1,3 +1,4 @@
+from flask import g
 from sqlalchemy.dialects.postgresql.array import ARRAY
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -110,11 +111,27 @@ class Group(db.Model):
 
     @staticmethod
     def all_access_groups():
-        return (
-            db.session.query(Group)
-            .filter(Group.capabilities.contains([Capabilities.access_all_objects]))
-            .all()
-        )
+        group_ids = Group.all_access_group_ids()
+        if not group_ids:
+            return []
+        return db.session.query(Group).filter(Group.id.in_(group_ids)).all()
+
+    @staticmethod
+    def all_access_group_ids():
+        """
+        Returns ids of groups that access all objects.
+
+        Result is memoized in the application context (flask.g), so
+        multiple objects uploaded in one request share a single query.
+        """
+        if "all_access_group_ids" not in g:
+            g.all_access_group_ids = [
+                group_id
+                for group_id, in db.session.query(Group.id).filter(
+                    Group.capabilities.contains([Capabilities.access_all_objects])
+                )
+            ]
+        return g.all_access_group_ids
 
     @staticmethod
     def all_default_groups():
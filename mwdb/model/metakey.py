@@ -127,11 +127,14 @@ class MetakeyDefinition(db.Model):
         back_populates="template",
         cascade="all, delete",
     )
+    # Don't load all attribute values along with definition.
+    # Values are removed by ON DELETE CASCADE when definition is deleted.
     metakey = db.relationship(
         "Metakey",
-        lazy="joined",
+        lazy="select",
         back_populates="template",
         cascade="all, delete",
+        passive_deletes=True,
     )
 
     @staticmethod
@@ -3,8 +3,10 @@ from typing import Optional
 
 from flask import g
 from sqlalchemy import and_, exists
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import aliased, contains_eager
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.expression import true
 
 from mwdb.core.capabilities import Capabilities
@@ -155,6 +157,9 @@ class ObjectPermission(db.Model):
                 )
             )
         ).scalar():
+            # Add permission in nested transaction, so a concurrently added
+            # permission rolls back only this insert
+            db.session.begin_nested()
             try:
                 perm = ObjectPermission(
                     object_id=object_id,
@@ -165,6 +170,7 @@ class ObjectPermission(db.Model):
                 )
                 db.session.add(perm)
                 db.session.flush()
+                db.session.commit()
                 # Capabilities were created right now
                 return True
             except IntegrityError:
@@ -285,23 +291,25 @@ class Object(db.Model):
         """
         Adding parent with permission inheritance
         """
-        if parent in self.parents:
+        # Add relationship using single statement.
+        # Nothing is inserted if relationship already exists.
+        result = db.session.execute(
+            postgresql.insert(relation)
+            .values(parent_id=parent.id, child_id=self.id)
+            .on_conflict_do_nothing(index_elements=["parent_id", "child_id"])
+        )
+        if not result.rowcount:
             # Relationship already exist
             return False
 
-        # Add relationship in nested transaction
-        db.session.begin_nested()
-        try:
-            self.parents.append(parent)
-            db.session.flush()
-            db.session.commit()
-        except IntegrityError:
-            # The same relationship was added concurrently
-            db.session.rollback()
-            db.session.refresh(self)
-            if parent not in self.parents:
-                raise
-            return False
+        # Reflect new relationship in collections that are already loaded.
+        # They're not expired because self.parents may contain only parents
+        # accessible by the current user (see Object.access)
+        if "parents" in self.__dict__:
+            set_committed_value(self, "parents", [parent] + list(self.parents))
+        if "children" in parent.__dict__:
+            set_committed_value(parent, "children", [self] + list(parent.children))
+
         # Inherit permissions from parent (in the same transaction)
         permissions = (
             db.session.query(ObjectPermission)
@@ -441,6 +449,60 @@ class Object(db.Model):
         if commit:
             db.session.commit()
 
+    def give_access_to_groups(
+        self,
+        group_ids,
+        reason_type,
+        related_object,
+        related_user,
+        commit=True,
+        propagate=True,
+    ):
+        """
+        Give access to multiple groups using single INSERT statement.
+
+        Propagation to children is performed only for groups that
+        didn't have access to this object yet. It can be turned off
+        for objects that were just created and don't have any children.
+        """
+        group_ids = set(group_ids)
+        if group_ids:
+            access_time = datetime.datetime.utcnow()
+            stmt = (
+                postgresql.insert(ObjectPermission.__table__)
+                .values(
+                    [
+                        {
+                            "object_id": self.id,
+                            "group_id": group_id,
+                            "access_time": access_time,
+                            "reason_type": reason_type,
+                            "related_object_id": related_object.id,
+                            "related_user_id": related_user.id,
+                        }
+                        for group_id in group_ids
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["object_id", "group_id"])
+                .returning(ObjectPermission.__table__.c.group_id)
+            )
+            created_group_ids = [group_id for group_id, in db.session.execute(stmt)]
+
+            # Permissions were just created: continue propagation
+            if propagate and created_group_ids:
+                for child in self.children:
+                    for group_id in created_group_ids:
+                        child.give_access(
+                            group_id,
+                            reason_type,
+                            related_object,
+                            related_user,
+                            commit=False,
+                        )
+
+        if commit:
+            db.session.commit()
+
     def has_explicit_access(self, user):
         """
         Check whether user has access via explicit ObjectPermissions
@@ -506,7 +568,8 @@ class Object(db.Model):
             new_cls = obj
             try:
                 # Try to create the requested object
-                new_cls.upload_time = datetime.datetime.utcnow()
+                if new_cls.upload_time is None:
+                    new_cls.upload_time = datetime.datetime.utcnow()
                 db.session.add(new_cls)
                 db.session.flush()
                 db.session.commit()
@@ -518,32 +581,30 @@ class Object(db.Model):
                 if new_cls is None:
                     raise
 
-        # Ensure that existing object has the expected type
-        if new_cls is not isinstance(obj, cls):
-            # If Object has been fetched, fetch typed instance
-            new_cls = cls.get(obj.dhash).first()
-            if new_cls is None:
-                raise ObjectTypeConflictError
+        # Ensure that existing object has the expected type.
+        # Polymorphic query returns instance of the proper subclass,
+        # so there is no need to fetch typed instance again.
+        if not isinstance(new_cls, cls):
+            raise ObjectTypeConflictError
 
         # Add metakeys
-        for metakey in metakeys:
-            new_cls.add_metakey(metakey["key"], metakey["value"], commit=False)
+        new_cls.add_metakeys(metakeys, commit=False)
 
         # Share with all specified groups
-        for share_group in share_with:
-            new_cls.give_access(
-                share_group.id, AccessType.ADDED, new_cls, g.auth_user, commit=False
-            )
-
-        # Share with all groups that access all objects
-        for all_access_group in Group.all_access_groups():
-            new_cls.give_access(
-                all_access_group.id,
-                AccessType.ADDED,
-                new_cls,
-                g.auth_user,
-                commit=False,
-            )
+        # and with all groups that access all objects
+        share_group_ids = {share_group.id for share_group in share_with} | set(
+            Group.all_access_group_ids()
+        )
+        # Just created object doesn't have children, so there is nothing to
+        # propagate (and no need to load the children collection)
+        new_cls.give_access_to_groups(
+            share_group_ids,
+            AccessType.ADDED,
+            new_cls,
+            g.auth_user,
+            commit=False,
+            propagate=not is_new,
+        )
 
         # Add parent to object if specified
         # Inherited share entries must be added AFTER we add share entries
@@ -571,9 +632,10 @@ class Object(db.Model):
         if requestor is None:
             requestor = g.auth_user
 
-        obj = cls.get(identifier)
+        query = cls.get(identifier)
+        obj = query.first()
         # If object doesn't exist - it doesn't exist
-        if obj.first() is None:
+        if obj is None:
             return None
 
         # In that case we want only those parents to which requestor has access.
@@ -582,7 +644,7 @@ class Object(db.Model):
             .filter(
                 Object.id.in_(
                     db.session.query(relation.c.parent_id).filter(
-                        relation.c.child_id == obj.first().id
+                        relation.c.child_id == obj.id
                     )
                 )
             )
@@ -593,7 +655,7 @@ class Object(db.Model):
         parent = aliased(Object, stmtp)
 
         obj = (
-            obj.outerjoin(parent, Object.parents)
+            query.outerjoin(parent, Object.parents)
             .options(contains_eager(Object.parents, alias=parent))
             .all()[0]
         )
@@ -715,16 +777,22 @@ class Object(db.Model):
         if not show_hidden:
             metakeys = metakeys.filter(MetakeyDefinition.hidden.is_(False))
 
-        metakeys = metakeys.order_by(Metakey.id).all()
+        metakeys = metakeys.order_by(Metakey.id)
 
         if not as_dict:
-            return metakeys
-
+            # Fill template from already joined definition instead of joining
+            # it once again. Definition permissions are not needed here and
+            # eager-loading them multiplies the rows by number of permissions.
+            return metakeys.options(
+                contains_eager(Metakey.template).lazyload(MetakeyDefinition.permissions)
+            ).all()
+
+        # Key-value pairs don't need Metakey entities
         dict_metakeys = {}
-        for metakey in metakeys:
-            if metakey.key not in dict_metakeys:
-                dict_metakeys[metakey.key] = []
-            dict_metakeys[metakey.key].append(metakey.value)
+        for key, value in metakeys.with_entities(Metakey.key, Metakey.value):
+            if key not in dict_metakeys:
+                dict_metakeys[key] = []
+            dict_metakeys[key].append(value)
         return dict_metakeys
 
     def add_metakey(self, key, value, commit=True, check_permissions=True):
@@ -745,6 +813,37 @@ class Object(db.Model):
             db.session.commit()
         return is_new
 
+    def add_metakeys(self, metakeys, commit=True):
+        """
+        Adds multiple metakeys using single INSERT statement.
+        Metakeys that are already set are skipped.
+
+        Doesn't perform permission checks: metakey definitions
+        need to be validated by Resource.
+
+        :param metakeys: List of dicts with "key" and "value"
+        """
+        if metakeys:
+            stmt = (
+                postgresql.insert(Metakey.__table__)
+                .values(
+                    [
+                        {
+                            "object_id": self.id,
+                            "key": metakey["key"],
+                            "value": metakey["value"],
+                        }
+                        for metakey in metakeys
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["object_id", "key", "value"])
+            )
+            db.session.execute(stmt)
+            # Collection needs to be reloaded with inserted metakeys
+            db.session.expire(self, ["meta"])
+        if commit:
+            db.session.commit()
+
     __mapper_args__ = {"polymorphic_identity": __tablename__, "polymorphic_on": type}
 
     def remove_metakey(self, key, value, check_permissions=True):
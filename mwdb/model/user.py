@@ -80,7 +80,7 @@ class User(db.Model):
 
     @property
     def capabilities(self):
-        return set.union(*[set(group.capabilities) for group in self.groups])
+        return set().union(*(group.capabilities for group in self.groups))
 
     def has_rights(self, perms):
         return perms in self.capabilities
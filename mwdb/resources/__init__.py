@@ -1,3 +1,4 @@
+import json
 from functools import wraps
 from json import JSONDecodeError
 
@@ -81,12 +82,17 @@ def access_object(object_type, identifier):
 
 
 def loads_schema(request_data, schema):
+    """
+    Parses JSON request data (str or raw bytes) and loads it using schema
+    """
     try:
-        obj = schema.loads(request_data, unknown=EXCLUDE)
+        obj = schema.load(json.loads(request_data), unknown=EXCLUDE)
     except ValidationError as val_err:
         raise BadRequest(f"ValidationError: {val_err}")
     except JSONDecodeError as json_decode_err:
         raise BadRequest(f"JSONDecodeError: {json_decode_err}")
+    except UnicodeDecodeError as unicode_decode_err:
+        raise BadRequest(f"UnicodeDecodeError: {unicode_decode_err}")
 
     return obj
 
@@ -107,24 +113,33 @@ def get_shares_for_upload(upload_as):
     Translates 'upload_as' value from API into list of groups that
     object will be shared with
     """
+    # User's groups are already loaded along with user,
+    # so try to find requested groups there before querying database
+    user_groups = {group.name: group for group in g.auth_user.groups}
+
+    def get_private_group():
+        return user_groups.get(g.auth_user.login) or Group.get_by_name(
+            g.auth_user.login
+        )
+
     if upload_as == "*":
         # If '*' is provided: share with all user's groups except 'public'
-        share_with = [group for group in g.auth_user.groups if group.workspace]
+        share_with = [group for group in user_groups.values() if group.workspace]
     elif upload_as == "private":
-        share_with = [Group.get_by_name(g.auth_user.login)]
+        share_with = [get_private_group()]
     else:
-        share_group = Group.get_by_name(upload_as)
+        share_group = user_groups.get(upload_as) or Group.get_by_name(upload_as)
         # Does group exist?
         if share_group is None:
             raise NotFound(f"Group {upload_as} doesn't exist")
         # Has user access to group?
-        if share_group not in g.auth_user.groups and not g.auth_user.has_rights(
+        if upload_as not in user_groups and not g.auth_user.has_rights(
             Capabilities.sharing_objects
         ):
             raise NotFound(f"Group {upload_as} doesn't exist")
         # Is group pending?
         if share_group.pending_group is True:
             raise NotFound(f"Group {upload_as} is pending")
-        share_with = [share_group, Group.get_by_name(g.auth_user.login)]
+        share_with = [share_group, get_private_group()]
 
     return share_with
@@ -68,7 +68,7 @@ class APIKeyIssueResource(Resource):
             id=uuid.uuid4(),
             user_id=api_key_owner.id,
             issued_by=g.auth_user.id,
-            issued_on=datetime.now(),
+            issued_on=datetime.utcnow(),
         )
         db.session.add(api_key)
         db.session.commit()
@@ -76,7 +76,7 @@ class LoginResource(Resource):
                 or system is set into maintenance mode.
         """
         schema = AuthLoginRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         try:
             user = User.query.filter(User.login == obj["login"]).one()
@@ -101,7 +101,7 @@ class LoginResource(Resource):
         if user.disabled:
             raise Forbidden("User account is disabled.")
 
-        user.logged_on = datetime.datetime.now()
+        user.logged_on = datetime.datetime.utcnow()
         db.session.commit()
 
         auth_token = user.generate_session_token()
@@ -152,7 +152,7 @@ class RegisterResource(Resource):
             raise Forbidden("User registration is not enabled.")
 
         schema = AuthRegisterRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         login = obj["login"]
 
@@ -213,7 +213,7 @@ class ChangePasswordResource(Resource):
                 description: When set password token is no longer valid
         """
         schema = AuthSetPasswordRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         user = User.verify_set_password_token(obj["token"])
         if user is None:
@@ -325,7 +325,7 @@ class RecoverPasswordResource(Resource):
                     on the server.
         """
         schema = AuthRecoverPasswordRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         try:
             user = User.query.filter(
@@ -387,7 +387,7 @@ class RefreshTokenResource(Resource):
         """
         user = g.auth_user
 
-        user.logged_on = datetime.datetime.now()
+        user.logged_on = datetime.datetime.utcnow()
         db.session.commit()
 
         logger.info("Session token refreshed", extra={"user": user.login})
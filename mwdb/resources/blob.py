@@ -15,6 +15,8 @@ from mwdb.schema.blob import (
 from . import loads_schema, requires_authorization, requires_capabilities
 from .object import ObjectItemResource, ObjectResource, ObjectUploader
 
+_blob_create_request_schema = BlobCreateRequestSchema()
+
 
 class TextBlobUploader(ObjectUploader):
     def _create_object(self, spec, parent, share_with, metakeys):
@@ -141,8 +143,7 @@ class TextBlobResource(ObjectResource, TextBlobUploader):
             409:
                 description: Object exists yet but has different type
         """
-        schema = BlobCreateRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), _blob_create_request_schema)
 
         return self.create_object(obj)
 
@@ -271,7 +272,7 @@ class TextBlobItemResource(ObjectItemResource, TextBlobUploader):
             409:
                 description: Object exists yet but has different type
         """
-        return super().put(identifier)
+        return self._upload(identifier)
 
     @requires_authorization
     @requires_capabilities(Capabilities.removing_objects)
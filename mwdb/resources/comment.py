@@ -107,7 +107,7 @@ class CommentResource(Resource):
         """
         schema = CommentRequestSchema()
 
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         db_object = access_object(type, identifier)
         if db_object is None:
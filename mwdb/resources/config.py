@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from flask import g, request
 from flask_restful import Resource
@@ -22,6 +22,14 @@ from mwdb.schema.config import (
 from . import load_schema, loads_schema, requires_authorization, requires_capabilities
 from .object import ObjectItemResource, ObjectResource, ObjectUploader
 
+_config_stats_request_schema = ConfigStatsRequestSchema()
+_config_stats_response_schema = ConfigStatsResponseSchema()
+_blob_create_spec_schema = BlobCreateSpecSchema()
+_config_create_request_schema = ConfigCreateRequestSchema()
+
+# Number of hours for 'range' units accepted by ConfigStatsResource
+_range_unit_hours = {"h": 1, "d": 24}
+
 
 class ConfigStatsResource(Resource):
     @requires_authorization
@@ -50,40 +58,35 @@ class ConfigStatsResource(Resource):
                   application/json:
                     schema: ConfigStatsResponseSchema
         """
-        schema = ConfigStatsRequestSchema()
-        params = load_schema(request.args, schema)
-
-        from_time = params["range"]
-        if from_time.endswith("h"):
-            from_time = int(from_time[:-1])
-        elif from_time.endswith("d"):
-            from_time = int(from_time[:-1]) * 24
-        elif from_time != "*":
-            raise BadRequest("Wrong range format")
+        params = load_schema(request.args, _config_stats_request_schema)
 
+        # Rows are labeled like ConfigStatsItemResponseSchema fields,
+        # so they can be serialized directly
         query = db.session.query(
-            Config.family, func.max(Config.upload_time).label("maxdate"), func.count()
+            Config.family,
+            func.max(Config.upload_time).label("last_upload"),
+            func.count().label("count"),
         ).group_by(Config.family)
 
-        if from_time != "*":
+        if params["range"] != "*":
+            range_value, range_unit = params["range"][:-1], params["range"][-1:]
+            try:
+                from_time = int(range_value) * _range_unit_hours[range_unit]
+            except (KeyError, ValueError):
+                raise BadRequest("Wrong range format")
+            # upload_time is stored as UTC timestamp without time zone
+            db_now = func.timezone("utc", func.now())
             query = query.filter(
-                Config.upload_time > (datetime.now() - timedelta(hours=from_time))
+                Config.upload_time > (db_now - timedelta(hours=from_time))
             )
 
-        families = [
-            {"family": family, "last_upload": upload_time, "count": count}
-            for family, upload_time, count in query.all()
-        ]
-
-        schema = ConfigStatsResponseSchema()
-        return schema.dump({"families": families})
+        return _config_stats_response_schema.dump({"families": query.all()})
 
 
 class ConfigUploader(ObjectUploader):
     def _get_embedded_blob(self, in_blob, share_with, metakeys):
         if isinstance(in_blob, dict):
-            schema = BlobCreateSpecSchema()
-            blob_spec = load_schema(in_blob, schema)
+            blob_spec = load_schema(in_blob, _blob_create_spec_schema)
 
             try:
                 blob_obj, is_new = TextBlob.get_or_create(
@@ -257,8 +260,7 @@ class ConfigResource(ObjectResource, ConfigUploader):
             409:
                 description: Object exists yet but has different type
         """
-        schema = ConfigCreateRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), _config_create_request_schema)
 
         return self.create_object(obj)
 
@@ -394,7 +396,7 @@ class ConfigItemResource(ObjectItemResource, ConfigUploader):
             409:
                 description: Object exists yet but has different type
         """
-        return super().put(identifier)
+        return self._upload(identifier)
 
     @requires_authorization
     @requires_capabilities(Capabilities.removing_objects)
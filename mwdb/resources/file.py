@@ -276,7 +276,38 @@ class FileItemResource(ObjectItemResource, FileUploader):
             409:
                 description: Object exists yet but has different type
         """
-        return super().post(identifier)
+        return self._upload(identifier)
+
+    @requires_authorization
+    @requires_capabilities(Capabilities.adding_files)
+    def put(self, identifier):
+        """
+        ---
+        summary: Upload file
+        description: |
+            Deprecated alias of `POST /file/{identifier}` method.
+            See its documentation for request parameters.
+
+            Requires `adding_files` capability.
+        security:
+            - bearerAuth: []
+        tags:
+            - deprecated
+        parameters:
+            - in: path
+              name: identifier
+              schema:
+                type: string
+              default: 'root'
+              description: Parent object identifier or `root` if there is no parent.
+        responses:
+            200:
+                description: Information about uploaded file
+                content:
+                  application/json:
+                    schema: FileItemResponseSchema
+        """
+        return self._upload(identifier)
 
     @requires_authorization
     @requires_capabilities(Capabilities.removing_objects)
@@ -140,7 +140,7 @@ class GroupResource(Resource):
                 description: When group exists yet
         """
         schema = GroupCreateRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         group_name_obj = load_schema({"name": name}, GroupNameSchemaBase())
 
@@ -203,7 +203,7 @@ class GroupResource(Resource):
                 description: When group doesn't exist
         """
         schema = GroupUpdateRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         group_name_obj = load_schema({"name": name}, GroupNameSchemaBase())
 
@@ -418,9 +418,7 @@ class GroupMemberResource(Resource):
 
         user_login_obj = load_schema({"login": login}, UserLoginSchemaBase())
 
-        membership = loads_schema(
-            request.get_data(as_text=True), GroupMemberUpdateRequestSchema()
-        )
+        membership = loads_schema(request.get_data(), GroupMemberUpdateRequestSchema())
 
         group = (
             db.session.query(Group)
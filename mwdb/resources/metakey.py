@@ -1,5 +1,6 @@
 from flask import g, request
 from flask_restful import Resource
+from sqlalchemy.dialects import postgresql
 from werkzeug.exceptions import BadRequest, Forbidden, NotFound
 
 from mwdb.core.capabilities import Capabilities
@@ -25,6 +26,28 @@ from . import (
     requires_capabilities,
 )
 
+_metakey_list_request_schema = MetakeyListRequestSchema()
+_metakey_list_response_schema = MetakeyListResponseSchema()
+_metakey_item_request_schema = MetakeyItemRequestSchema()
+_metakey_definition_list_response_schema = MetakeyDefinitionListResponseSchema()
+_metakey_definition_manage_list_response_schema = (
+    MetakeyDefinitionManageListResponseSchema()
+)
+_metakey_definition_manage_item_response_schema = (
+    MetakeyDefinitionManageItemResponseSchema()
+)
+_metakey_definition_item_request_args_schema = MetakeyDefinitionItemRequestArgsSchema()
+_metakey_definition_item_request_body_schema = MetakeyDefinitionItemRequestBodySchema()
+_metakey_permission_set_request_args_schema = MetakeyPermissionSetRequestArgsSchema()
+_metakey_permission_set_request_body_schema = MetakeyPermissionSetRequestBodySchema()
+
+
+def _get_group_id(name):
+    """
+    Resolves group name to its id without loading the whole Group entity
+    """
+    return db.session.query(Group.id).filter(Group.name == name).scalar()
+
 
 class MetakeyResource(Resource):
     @requires_authorization
@@ -73,8 +96,7 @@ class MetakeyResource(Resource):
                     When object doesn't exist or user doesn't have
                     access to this object.
         """
-        schema = MetakeyListRequestSchema()
-        obj = load_schema(request.args, schema)
+        obj = load_schema(request.args, _metakey_list_request_schema)
 
         show_hidden = obj["hidden"]
         if show_hidden and not g.auth_user.has_rights(
@@ -87,8 +109,7 @@ class MetakeyResource(Resource):
             raise NotFound("Object not found")
 
         metakeys = db_object.get_metakeys(show_hidden=show_hidden)
-        schema = MetakeyListResponseSchema()
-        return schema.dump({"metakeys": metakeys})
+        return _metakey_list_response_schema.dump({"metakeys": metakeys})
 
     @requires_authorization
     def post(self, type, identifier):
@@ -135,8 +156,7 @@ class MetakeyResource(Resource):
                     When attribute key is not defined or user doesn't have
                     privileges to set that one.
         """
-        schema = MetakeyItemRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), _metakey_item_request_schema)
 
         db_object = access_object(type, identifier)
         if db_object is None:
@@ -154,8 +174,7 @@ class MetakeyResource(Resource):
         db.session.commit()
         db.session.refresh(db_object)
         metakeys = db_object.get_metakeys()
-        schema = MetakeyListResponseSchema()
-        return schema.dump({"metakeys": metakeys})
+        return _metakey_list_response_schema.dump({"metakeys": metakeys})
 
     @requires_authorization
     @requires_capabilities("removing_attributes")
@@ -205,8 +224,7 @@ class MetakeyResource(Resource):
                     When attribute key is not defined or user doesn't have privileges
                     to set that one.
         """
-        schema = MetakeyItemRequestSchema()
-        obj = load_schema(request.args, schema)
+        obj = load_schema(request.args, _metakey_item_request_schema)
 
         db_object = access_object(type, identifier)
         if db_object is None:
@@ -261,8 +279,7 @@ class MetakeyListDefinitionResource(Resource):
             raise BadRequest(f"Unknown desired access type '{access}'")
 
         metakeys = metakeys.order_by(MetakeyDefinition.key).all()
-        schema = MetakeyDefinitionListResponseSchema()
-        return schema.dump({"metakeys": metakeys})
+        return _metakey_definition_list_response_schema.dump({"metakeys": metakeys})
 
 
 class MetakeyListDefinitionManageResource(Resource):
@@ -292,8 +309,9 @@ class MetakeyListDefinitionManageResource(Resource):
         metakeys = (
             db.session.query(MetakeyDefinition).order_by(MetakeyDefinition.key).all()
         )
-        schema = MetakeyDefinitionManageListResponseSchema()
-        return schema.dump({"metakeys": metakeys})
+        return _metakey_definition_manage_list_response_schema.dump(
+            {"metakeys": metakeys}
+        )
 
 
 class MetakeyDefinitionManageResource(Resource):
@@ -335,8 +353,7 @@ class MetakeyDefinitionManageResource(Resource):
         )
         if metakey is None:
             raise NotFound("No such metakey")
-        schema = MetakeyDefinitionManageItemResponseSchema()
-        return schema.dump(metakey)
+        return _metakey_definition_manage_item_response_schema.dump(metakey)
 
     @requires_authorization
     @requires_capabilities(Capabilities.managing_attributes)
@@ -375,24 +392,41 @@ class MetakeyDefinitionManageResource(Resource):
             403:
                 description: When user doesn't have `managing_attributes` capability.
         """
-        schema = MetakeyDefinitionItemRequestArgsSchema()
-        args_obj = load_schema({"key": key}, schema)
+        args_obj = load_schema(
+            {"key": key}, _metakey_definition_item_request_args_schema
+        )
 
-        schema = MetakeyDefinitionItemRequestBodySchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(
+            request.get_data(), _metakey_definition_item_request_body_schema
+        )
 
-        metakey_definition = MetakeyDefinition(
+        # Upsert using single statement instead of SELECT followed by INSERT/UPDATE
+        stmt = postgresql.insert(MetakeyDefinition.__table__).values(
             key=args_obj["key"],
             url_template=obj["url_template"],
             label=obj["label"],
             description=obj["description"],
             hidden=obj["hidden"],
         )
-        metakey_definition = db.session.merge(metakey_definition)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "url_template": stmt.excluded.url_template,
+                "label": stmt.excluded.label,
+                "description": stmt.excluded.description,
+                "hidden": stmt.excluded.hidden,
+            },
+        )
+        db.session.execute(stmt)
         db.session.commit()
 
-        schema = MetakeyDefinitionManageItemResponseSchema()
-        return schema.dump(metakey_definition)
+        metakey_definition = (
+            db.session.query(MetakeyDefinition)
+            .filter(MetakeyDefinition.key == args_obj["key"])
+            .one()
+        )
+
+        return _metakey_definition_manage_item_response_schema.dump(metakey_definition)
 
     @requires_authorization
     @requires_capabilities(Capabilities.managing_attributes)
@@ -479,11 +513,14 @@ class MetakeyPermissionResource(Resource):
             404:
                 description: When attribute key or group doesn't exist
         """
-        schema = MetakeyPermissionSetRequestArgsSchema()
-        args_obj = load_schema({"key": key, "group_name": group_name}, schema)
+        args_obj = load_schema(
+            {"key": key, "group_name": group_name},
+            _metakey_permission_set_request_args_schema,
+        )
 
-        schema = MetakeyPermissionSetRequestBodySchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(
+            request.get_data(), _metakey_permission_set_request_body_schema
+        )
 
         metakey_definition = (
             db.session.query(MetakeyDefinition)
@@ -493,24 +530,29 @@ class MetakeyPermissionResource(Resource):
         if metakey_definition is None:
             raise NotFound("No such metakey")
 
-        group = (
-            db.session.query(Group).filter(Group.name == args_obj["group_name"]).first()
-        )
-        if group is None:
+        group_id = _get_group_id(args_obj["group_name"])
+        if group_id is None:
             raise NotFound("No such group")
 
-        permission = MetakeyPermission(
+        # Upsert using single statement instead of SELECT followed by INSERT/UPDATE
+        stmt = postgresql.insert(MetakeyPermission.__table__).values(
             key=args_obj["key"],
-            group_id=group.id,
+            group_id=group_id,
             can_read=obj["can_read"],
             can_set=obj["can_set"],
         )
-        db.session.merge(permission)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key", "group_id"],
+            set_={
+                "can_read": stmt.excluded.can_read,
+                "can_set": stmt.excluded.can_set,
+            },
+        )
+        db.session.execute(stmt)
         db.session.commit()
 
         db.session.refresh(metakey_definition)
-        schema = MetakeyDefinitionManageItemResponseSchema()
-        return schema.dump(metakey_definition)
+        return _metakey_definition_manage_item_response_schema.dump(metakey_definition)
 
     @requires_authorization
     @requires_capabilities(Capabilities.managing_attributes)
@@ -546,20 +588,20 @@ class MetakeyPermissionResource(Resource):
                 description: |
                     When attribute key or group or group permission doesn't exist
         """
-        schema = MetakeyPermissionSetRequestArgsSchema()
-        args_obj = load_schema({"key": key, "group_name": group_name}, schema)
-
-        group = (
-            db.session.query(Group).filter(Group.name == args_obj["group_name"]).first()
+        args_obj = load_schema(
+            {"key": key, "group_name": group_name},
+            _metakey_permission_set_request_args_schema,
         )
-        if group is None:
+
+        group_id = _get_group_id(args_obj["group_name"])
+        if group_id is None:
             raise NotFound("No such group")
 
         metakey_permission = (
             db.session.query(MetakeyPermission)
             .filter(
                 MetakeyPermission.key == args_obj["key"],
-                MetakeyPermission.group_id == group.id,
+                MetakeyPermission.group_id == group_id,
             )
             .first()
         )
@@ -3,6 +3,7 @@ import json
 from flask import g, request
 from flask_restful import Resource
 from luqum.parser import ParseError
+from sqlalchemy.orm import raiseload, selectinload
 from werkzeug.exceptions import BadRequest, Forbidden, MethodNotAllowed, NotFound
 
 from mwdb.core.capabilities import Capabilities
@@ -59,11 +60,21 @@ class ObjectUploader:
         else:
             parent_object = None
 
-        # Validate metakeys
+        # Validate metakeys (all keys are checked using single query)
         metakeys = params["metakeys"]
-        for metakey in params["metakeys"]:
+        settable_keys = set()
+        if metakeys:
+            settable_keys = {
+                key
+                for key, in MetakeyDefinition.query_for_set()
+                .filter(
+                    MetakeyDefinition.key.in_({metakey["key"] for metakey in metakeys})
+                )
+                .with_entities(MetakeyDefinition.key)
+            }
+        for metakey in metakeys:
             key = metakey["key"]
-            if not MetakeyDefinition.query_for_set(key).first():
+            if key not in settable_keys:
                 raise NotFound(
                     f"Metakey '{key}' not defined or insufficient "
                     "permissions to set that one"
@@ -72,7 +83,13 @@ class ObjectUploader:
         # Validate upload_as argument
         share_with = get_shares_for_upload(params["upload_as"])
 
-        item, is_new = self._create_object(params, parent_object, share_with, metakeys)
+        # Changes are flushed explicitly where needed (e.g. to get new object id)
+        # and committed at once below, so lookups made during object creation
+        # don't need to flush pending changes each time.
+        with db.session.no_autoflush:
+            item, is_new = self._create_object(
+                params, parent_object, share_with, metakeys
+            )
 
         try:
             db.session.commit()
@@ -87,7 +104,8 @@ class ObjectUploader:
             item.release_after_upload()
 
         logger.info(
-            f"{self.ObjectType.__name__} added",
+            "%s added",
+            self.ObjectType.__name__,
             extra={"dhash": item.dhash, "is_new": is_new},
         )
         schema = self.ItemResponseSchema()
@@ -178,6 +196,12 @@ class ObjectResource(Resource):
         elif obj["page"] is not None and obj["page"] > 1:
             db_query = db_query.offset((obj["page"] - 1) * 10)
 
+        # List schemas serialize only tags: load them using separate
+        # IN query instead of joining them with limited query.
+        # Other relationships are not loaded and accessing them raises
+        # an error instead of emitting N additional queries.
+        db_query = db_query.options(selectinload(Object.tags), raiseload("*"))
+
         objects = db_query.limit(10).all()
 
         schema = self.ListResponseSchema()
@@ -234,21 +258,26 @@ class ObjectItemResource(Resource, ObjectUploader):
             # If request is application/json: all args are in JSON
             args = json.loads(request.get_data(parse_form_data=True, as_text=True))
         else:
-            if "json" in request.form:
+            form = request.form
+            if "json" in form:
                 # If request is multipart/form-data:
                 # some args are in JSON and some are part of form
-                args = json.loads(request.form["json"])
+                args = json.loads(form["json"])
             else:
                 args = {}
-            if request.form.get("metakeys"):
-                args["metakeys"] = request.form["metakeys"]
-            if request.form.get("upload_as"):
-                args["upload_as"] = request.form["upload_as"]
+            metakeys = form.get("metakeys")
+            if metakeys:
+                args["metakeys"] = metakeys
+            upload_as = form.get("upload_as")
+            if upload_as:
+                args["upload_as"] = upload_as
         args["parent"] = parent_identifier if parent_identifier != "root" else None
         return args
 
-    @requires_authorization
-    def post(self, identifier):
+    def _upload(self, identifier):
+        """
+        Common implementation of legacy POST and PUT upload methods
+        """
         if self.ObjectType is Object:
             raise MethodNotAllowed()
 
@@ -257,9 +286,13 @@ class ObjectItemResource(Resource, ObjectUploader):
 
         return self.create_object(obj)
 
+    @requires_authorization
+    def post(self, identifier):
+        return self._upload(identifier)
+
     @requires_authorization
     def put(self, identifier):
-        return self.post(identifier)
+        return self._upload(identifier)
 
     @requires_authorization
     @requires_capabilities(Capabilities.removing_objects)
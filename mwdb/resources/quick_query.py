@@ -41,7 +41,7 @@ class QuickQueryResource(Resource):
                 description: When query is invalid
         """
         schema = QuickQuerySchemaBase()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         quick_query = QuickQuery(
             query=obj["query"],
@@ -130,7 +130,8 @@ class RemotePullResource(Resource):
             item.release_after_upload()
 
         logger.info(
-            f"{self.ObjectType.__name__} added",
+            "%s added",
+            self.ObjectType.__name__,
             extra={"dhash": item.dhash, "is_new": is_new},
         )
         schema = self.ItemResponseSchema()
@@ -189,20 +190,19 @@ class RemoteFilePullResource(RemotePullResource):
         response = remote.request("GET", f"file/{identifier}")
         file_name = response.json()["file_name"]
         response = remote.request("GET", f"file/{identifier}/download", stream=True)
-        options = loads_schema(
-            request.get_data(as_text=True), RemoteOptionsRequestSchema()
-        )
+        options = loads_schema(request.get_data(), RemoteOptionsRequestSchema())
         share_with = get_shares_for_upload(options["upload_as"])
         with SpooledTemporaryFile() as file_stream:
             for chunk in response.iter_content(chunk_size=2 ** 16):
                 file_stream.write(chunk)
             file_stream.seek(0)
             try:
-                item, is_new = File.get_or_create(
-                    file_name=file_name,
-                    file_stream=file_stream,
-                    share_with=share_with,
-                )
+                with db.session.no_autoflush:
+                    item, is_new = File.get_or_create(
+                        file_name=file_name,
+                        file_stream=file_stream,
+                        share_with=share_with,
+                    )
             except ObjectTypeConflictError:
                 raise Conflict("Object already exists locally and is not a file")
 
@@ -263,45 +263,48 @@ class RemoteConfigPullResource(RemotePullResource):
         """
         remote = RemoteAPI(remote_name)
         config_spec = remote.request("GET", f"config/{identifier}").json()
-        options = loads_schema(
-            request.get_data(as_text=True), RemoteOptionsRequestSchema()
-        )
+        options = loads_schema(request.get_data(), RemoteOptionsRequestSchema())
         share_with = get_shares_for_upload(options["upload_as"])
         try:
-            config = dict(config_spec["cfg"])
-            blobs = []
-            for first, second in config.items():
-                if isinstance(second, dict) and list(second.keys()) == ["in-blob"]:
-                    if not g.auth_user.has_rights(Capabilities.adding_blobs):
-                        raise Forbidden("You are not permitted to add blob objects")
-                    in_blob = second["in-blob"]
-                    if not isinstance(in_blob, str):
-                        raise BadRequest("'in-blob' is not a correct blob reference")
-                    blob_obj = TextBlob.access(in_blob)
-                    if not blob_obj:
-                        # If blob object doesn't exist locally: pull it as well
-                        blob_spec = remote.request("GET", f"blob/{in_blob}").json()
-                        blob_obj, _ = TextBlob.get_or_create(
-                            content=blob_spec["content"],
-                            blob_name=blob_spec["blob_name"],
-                            blob_type=blob_spec["blob_type"],
-                            share_with=share_with,
-                        )
-                    blobs.append(blob_obj)
-                    config[first]["in-blob"] = blob_obj.dhash
-
-                elif isinstance(second, dict) and ("in-blob" in list(second.keys())):
-                    raise BadRequest("'in-blob' should be the only key")
-
-            item, is_new = Config.get_or_create(
-                cfg=config_spec["cfg"],
-                family=config_spec["family"],
-                config_type=config_spec["config_type"],
-                share_with=share_with,
-            )
+            with db.session.no_autoflush:
+                config = dict(config_spec["cfg"])
+                blobs = []
+                for first, second in config.items():
+                    if isinstance(second, dict) and list(second.keys()) == ["in-blob"]:
+                        if not g.auth_user.has_rights(Capabilities.adding_blobs):
+                            raise Forbidden("You are not permitted to add blob objects")
+                        in_blob = second["in-blob"]
+                        if not isinstance(in_blob, str):
+                            raise BadRequest(
+                                "'in-blob' is not a correct blob reference"
+                            )
+                        blob_obj = TextBlob.access(in_blob)
+                        if not blob_obj:
+                            # If blob object doesn't exist locally: pull it as well
+                            blob_spec = remote.request("GET", f"blob/{in_blob}").json()
+                            blob_obj, _ = TextBlob.get_or_create(
+                                content=blob_spec["content"],
+                                blob_name=blob_spec["blob_name"],
+                                blob_type=blob_spec["blob_type"],
+                                share_with=share_with,
+                            )
+                        blobs.append(blob_obj)
+                        config[first]["in-blob"] = blob_obj.dhash
+
+                    elif isinstance(second, dict) and (
+                        "in-blob" in list(second.keys())
+                    ):
+                        raise BadRequest("'in-blob' should be the only key")
+
+                item, is_new = Config.get_or_create(
+                    cfg=config_spec["cfg"],
+                    family=config_spec["family"],
+                    config_type=config_spec["config_type"],
+                    share_with=share_with,
+                )
 
-            for blob in blobs:
-                blob.add_parent(item, commit=False)
+                for blob in blobs:
+                    blob.add_parent(item, commit=False)
         except ObjectTypeConflictError:
             raise Conflict("Object already exists and is not a config")
 
@@ -357,17 +360,16 @@ class RemoteTextBlobPullResource(RemotePullResource):
         """
         remote = RemoteAPI(remote_name)
         spec = remote.request("GET", f"blob/{identifier}").json()
-        options = loads_schema(
-            request.get_data(as_text=True), RemoteOptionsRequestSchema()
-        )
+        options = loads_schema(request.get_data(), RemoteOptionsRequestSchema())
         share_with = get_shares_for_upload(options["upload_as"])
         try:
-            item, is_new = TextBlob.get_or_create(
-                content=spec["content"],
-                blob_name=spec["blob_name"],
-                blob_type=spec["blob_type"],
-                share_with=share_with,
-            )
+            with db.session.no_autoflush:
+                item, is_new = TextBlob.get_or_create(
+                    content=spec["content"],
+                    blob_name=spec["blob_name"],
+                    blob_type=spec["blob_type"],
+                    share_with=share_with,
+                )
         except ObjectTypeConflictError:
             raise Conflict("Object already exists and is not a config")
 
@@ -416,9 +418,7 @@ class RemoteFilePushResource(RemotePullResource):
             raise NotFound("Object not found")
 
         remote = RemoteAPI(remote_name)
-        options = loads_schema(
-            request.get_data(as_text=True), RemoteOptionsRequestSchema()
-        )
+        options = loads_schema(request.get_data(), RemoteOptionsRequestSchema())
         response = remote.request(
             "POST",
             "file",
@@ -428,7 +428,8 @@ class RemoteFilePushResource(RemotePullResource):
             },
         ).json()
         logger.info(
-            f"{db_object.type} pushed remote",
+            "%s pushed remote",
+            db_object.type,
             extra={"dhash": db_object.dhash, "remote_name": remote_name},
         )
         return response
@@ -494,9 +495,7 @@ class RemoteConfigPushResource(RemotePullResource):
                 }
 
         remote = RemoteAPI(remote_name)
-        options = loads_schema(
-            request.get_data(as_text=True), RemoteOptionsRequestSchema()
-        )
+        options = loads_schema(request.get_data(), RemoteOptionsRequestSchema())
         params = {
             "family": db_object.family,
             "cfg": config,
@@ -505,7 +504,8 @@ class RemoteConfigPushResource(RemotePullResource):
         }
         response = remote.request("POST", "config", json=params).json()
         logger.info(
-            f"{db_object.type} pushed remote",
+            "%s pushed remote",
+            db_object.type,
             extra={"dhash": db_object.dhash, "remote_name": remote_name},
         )
         return response
@@ -553,9 +553,7 @@ class RemoteTextBlobPushResource(RemotePullResource):
             raise NotFound("Object not found")
 
         remote = RemoteAPI(remote_name)
-        options = loads_schema(
-            request.get_data(as_text=True), RemoteOptionsRequestSchema()
-        )
+        options = loads_schema(request.get_data(), RemoteOptionsRequestSchema())
         params = {
             "blob_name": db_object.blob_name,
             "blob_type": db_object.blob_type,
@@ -564,7 +562,8 @@ class RemoteTextBlobPushResource(RemotePullResource):
         }
         response = remote.request("POST", "blob", json=params).json()
         logger.info(
-            f"{db_object.type} pushed remote",
+            "%s pushed remote",
+            db_object.type,
             extra={"dhash": db_object.dhash, "remote_name": remote_name},
         )
         return response
@@ -45,7 +45,7 @@ class SearchResource(Resource):
                 description: When request body or query syntax is invalid
         """
         schema = SearchRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         query = obj["query"]
         try:
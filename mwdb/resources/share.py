@@ -163,7 +163,7 @@ class ShareResource(Resource):
                     or user doesn't have access to.
         """
         schema = ShareRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         db_object = access_object(type, identifier)
         if db_object is None:
@@ -173,7 +173,7 @@ class TagResource(Resource):
                     access to this object.
         """
         schema = TagRequestSchema()
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         db_object = access_object(type, identifier)
         if db_object is None:
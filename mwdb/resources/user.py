@@ -116,7 +116,7 @@ class UserPendingResource(Resource):
             .first()
         )
         user.pending = False
-        user.registered_on = datetime.datetime.now()
+        user.registered_on = datetime.datetime.utcnow()
         user.registered_by = g.auth_user.id
         db.session.add(user)
 
@@ -356,7 +356,7 @@ class UserResource(Resource):
         """
         schema = UserCreateRequestSchema()
 
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         user_login_obj = load_schema({"login": login}, UserLoginSchemaBase())
 
@@ -445,7 +445,7 @@ class UserResource(Resource):
         """
         schema = UserUpdateRequestSchema()
 
-        obj = loads_schema(request.get_data(as_text=True), schema)
+        obj = loads_schema(request.get_data(), schema)
 
         user_login_obj = load_schema({"login": login}, UserLoginSchemaBase())
 
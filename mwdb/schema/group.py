@@ -1,14 +1,14 @@
-import re
-
 from marshmallow import Schema, ValidationError, fields, validates
 
+from .utils import NAME_PATTERN
+
 
 class GroupNameSchemaBase(Schema):
     name = fields.Str(required=True, allow_none=False)
 
     @validates("name")
     def validate_name(self, name):
-        if not re.match("^[A-Za-z0-9_-]{1,32}$", name):
+        if not NAME_PATTERN.match(name):
             raise ValidationError(
                 "Group should contain max 32 chars and include only "
                 "letters, digits, underscores and dashes"
@@ -29,7 +29,7 @@ class GroupUpdateRequestSchema(Schema):
 
     @validates("name")
     def validate_name(self, name):
-        if name is not None and not re.match("^[A-Za-z0-9_-]{1,32}$", name):
+        if name is not None and not NAME_PATTERN.match(name):
             raise ValidationError(
                 "Group should contain max 32 chars and include only "
                 "letters, digits, underscores and dashes"
@@ -1,7 +1,7 @@
-import re
-
 from marshmallow import Schema, ValidationError, fields, pre_load, validates
 
+from .utils import NAME_PATTERN
+
 
 class MetakeyKeySchema(Schema):
     key = fields.Str(required=True, allow_none=False)
@@ -15,7 +15,7 @@ class MetakeyKeySchema(Schema):
 
     @validates("key")
     def validate_key(self, value):
-        if not re.match("^[A-Za-z0-9_-]{1,32}$", value):
+        if not NAME_PATTERN.match(value):
             raise ValidationError(
                 "Key should contain max 32 chars and include only letters, "
                 "digits, underscores and dashes"
@@ -1,8 +1,6 @@
-import re
-
 from marshmallow import Schema, ValidationError, fields, validates
 
-from .utils import UTCDateTime
+from .utils import NAME_PATTERN, UTCDateTime
 
 
 class ShareRequestSchema(Schema):
@@ -10,7 +8,7 @@ class ShareRequestSchema(Schema):
 
     @validates("group")
     def validate_name(self, name):
-        if not re.match("^[A-Za-z0-9_-]{1,32}$", name):
+        if not NAME_PATTERN.match(name):
             raise ValidationError(
                 "Group should contain max 32 chars and include only "
                 "letters, digits, underscores and dashes"
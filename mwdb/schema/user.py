@@ -1,10 +1,8 @@
-import re
-
 from marshmallow import Schema, ValidationError, fields, validates
 
 from .api_key import APIKeyListItemResponseSchema
 from .group import GroupBasicResponseSchema, GroupNameSchemaBase
-from .utils import UTCDateTime
+from .utils import NAME_PATTERN, UTCDateTime
 
 
 class UserLoginSchemaBase(Schema):
@@ -12,7 +10,7 @@ class UserLoginSchemaBase(Schema):
 
     @validates("login")
     def validate_login(self, value):
-        if not re.match("^[A-Za-z0-9_-]{1,32}$", value):
+        if not NAME_PATTERN.match(value):
             raise ValidationError(
                 "Login should contain max 32 chars and include only "
                 "letters, digits, underscores and dashes"
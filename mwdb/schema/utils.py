@@ -1,7 +1,11 @@
+import re
 from datetime import datetime, timezone
 
 from marshmallow import fields
 
+# Allowed format of names (logins, group names, attribute keys)
+NAME_PATTERN = re.compile("^[A-Za-z0-9_-]{1,32}$")
+
 
 class UTCDateTime(fields.DateTime):
     """
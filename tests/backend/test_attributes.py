@@ -143,3 +143,31 @@ def test_metakey_definition_remove(admin, attr_user):
     assert len(attrs) == 0
     with ShouldRaise(404):
         admin.get_attribute(attr_name)
+
+
+def test_metakey_upload(admin, attr_user):
+    attr_name = random_name().lower()
+    other_attr_name = random_name().lower()
+    admin.add_attribute_definition(attr_name, "")
+    admin.add_attribute_definition(other_attr_name, "")
+    admin.add_attribute_permission(attr_name, group="attr", can_read=True, can_set=True)
+
+    # User is not allowed to set one of keys
+    with ShouldRaise(404):
+        attr_user.add_sample(
+            metakeys=[
+                {"key": attr_name, "value": "random_value"},
+                {"key": other_attr_name, "value": "random_value"},
+            ]
+        )
+
+    # Duplicated attributes are added only once
+    sample_id = attr_user.add_sample(
+        metakeys=[
+            {"key": attr_name, "value": "random_value"},
+            {"key": attr_name, "value": "random_value"},
+            {"key": attr_name, "value": "other_value"},
+        ]
+    )["id"]
+    attrs = attr_user.get_attributes(sample_id)["metakeys"]
+    assert sorted(attr["value"] for attr in attrs) == ["other_value", "random_value"]
@@ -1,4 +1,5 @@
 from .relations import *
+from .utils import MwdbTest, ShouldRaise, rand_string
 
 
 def test_adding_config_with_inblobs():
@@ -34,3 +35,53 @@ def test_adding_config_with_inblobs():
 
     assert blob1["blob_name"] in ["In blob name", "Peers blob name"] and \
            blob2["blob_name"] in ["In blob name", "Peers blob name"]
+
+
+def test_config_stats():
+    test = MwdbTest()
+    test.login()
+
+    family = rand_string(16)
+    test.add_config(None, family, {"cnc": [rand_string()]})
+    test.add_config(None, family, {"cnc": [rand_string()]})
+
+    for time_range in ["*", "24h", "7d"]:
+        stats = test.request("GET", "/config/stats", params={"range": time_range})
+        family_stats = [f for f in stats["families"] if f["family"] == family]
+        assert len(family_stats) == 1
+        assert family_stats[0]["count"] == 2
+
+    for time_range in ["24", "xh", "7w", ""]:
+        with ShouldRaise(400):
+            test.request("GET", "/config/stats", params={"range": time_range})
+
+
+def test_config_big_integer():
+    test = MwdbTest()
+    test.login()
+
+    family = rand_string(16)
+    # Integers exceeding 64-bit range (e.g. RSA modulus) must be kept as-is
+    big_integer = 2 ** 1024 + 1
+    config_json = {"rsa_modulus": big_integer, "cnc": [rand_string()]}
+
+    config = test.add_config(None, family, config_json)
+    assert config["cfg"]["rsa_modulus"] == big_integer
+
+    # Legacy upload path must produce the same object
+    legacy_config = test.request("PUT", "/config/root", json={
+        "family": family,
+        "cfg": config_json
+    })
+    assert legacy_config["id"] == config["id"]
+
+
+def test_get_config_big_integer():
+    test = MwdbTest()
+    test.login()
+
+    big_integer = 2 ** 1024 + 1
+    config = test.add_config(None, rand_string(16), {"rsa_modulus": big_integer})
+
+    config = test.get_config(config["id"])
+    assert config["cfg"]["rsa_modulus"] == big_integer
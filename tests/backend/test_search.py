@@ -252,6 +252,32 @@ def test_search_file_size_unbounded():
     assert len(found_objs) == 0
 
 
+def test_search_repeated_query():
+    test = MwdbTest()
+    test.login()
+
+    filename = base62uuid()
+    file_content = b"a" * 1500
+    tag = "repeated_query_search"
+
+    sample = test.add_sample(filename, file_content)
+    test.add_tag(sample["id"], tag)
+
+    # Parsed queries are cached, so repeated query must give the same results.
+    # Bounds differ from file size, so altered range would change the result.
+    expected = {
+        f'file.name:"{filename}" AND tag:{tag}': [sample["id"]],
+        f'file.size:>=1000 AND tag:{tag}': [sample["id"]],
+        f'file.size:[1000 TO *] AND tag:{tag}': [sample["id"]],
+        f'file.size:<1000 AND tag:{tag}': [],
+        f'file.size:[* TO 1000}} AND tag:{tag}': [],
+    }
+    for _ in range(3):
+        for query, expected_ids in expected.items():
+            found_objs = test.search(query)
+            assert [obj["id"] for obj in found_objs] == expected_ids
+
+
 def test_search_date_time_unbounded():
     test = MwdbTest()
     test.login()